@@ -57,7 +57,6 @@ async def _run(  # noqa: PLR0915 -- top-level wiring + poll loop; E2E tests
     # on paho's network thread and must hop back here via
     # loop.call_soon_threadsafe to touch publisher state (C2).
     loop = asyncio.get_running_loop()
-    stop_event = asyncio.Event()
     connected_event = asyncio.Event()
 
     def _on_connect(
@@ -138,12 +137,11 @@ async def _run(  # noqa: PLR0915 -- top-level wiring + poll loop; E2E tests
     logger.info("poll_loop_started", interval=config.poll_interval)
 
     try:
-        while not stop_event.is_set():
-            try:
-                await asyncio.wait_for(stop_event.wait(), timeout=config.poll_interval)
-                break  # stop_event was set
-            except TimeoutError:
-                pass  # poll interval elapsed, do a cycle
+        while True:
+            # Shutdown arrives as task cancellation (SIGTERM/SIGINT in main(),
+            # task.cancel() in tests), which interrupts this sleep directly —
+            # no stop event or per-cycle wait_for timer to build and tear down.
+            await asyncio.sleep(config.poll_interval)
 
             try:
                 readings = await source.query()
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Final
 
 import yaml
 
-from openwrt_presence.domain import Mac, NodeName, PersonName, Room
+from openwrt_presence.domain import Mac, NodeName, PersonName, Room, normalize_mac
+
+try:
+    # libyaml-backed loader — same safe constructor set as SafeLoader,
+    # roughly an order of magnitude faster to parse.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -23,19 +31,19 @@ class ConfigError(Exception):
     """Raised when configuration is invalid."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NodeConfig:
     room: Room
     url: str | None = None
     exit: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PersonConfig:
     macs: list[Mac]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MqttConfig:
     host: str
     port: int
@@ -44,7 +52,7 @@ class MqttConfig:
     password: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Config:
     mqtt: MqttConfig
     nodes: dict[NodeName, NodeConfig]
@@ -57,24 +65,47 @@ class Config:
     _mac_lookup: dict[Mac, PersonName] = field(
         default_factory=lambda: {}, repr=False, compare=False
     )
+    # Derived from ``nodes`` / ``exporter_port`` in ``__post_init__``.
+    # The config is frozen, so these can never go stale — materialise
+    # them once instead of rebuilding on every access.
+    node_urls: dict[NodeName, str] = field(init=False, repr=False, compare=False)
+    has_exit_nodes: bool = field(init=False, repr=False, compare=False)
+    _node_timeouts: dict[NodeName, int] = field(init=False, repr=False, compare=False)
+    _default_timeout: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # ``object.__setattr__`` is the frozen-dataclass escape hatch for
+        # derived fields; nothing else may write to the instance.
+        object.__setattr__(
+            self,
+            "node_urls",
+            {
+                name: node.url or f"http://{name}:{self.exporter_port}/metrics"
+                for name, node in self.nodes.items()
+            },
+        )
+        object.__setattr__(
+            self, "has_exit_nodes", any(n.exit for n in self.nodes.values())
+        )
+        # Exit-vs-interior resolution is evaluated here, once per node, so
+        # timeout_for_node is a single lookup on the engine's hot path.
+        default_timeout = (
+            self.away_timeout if self.has_exit_nodes else self.departure_timeout
+        )
+        object.__setattr__(self, "_default_timeout", default_timeout)
+        object.__setattr__(
+            self,
+            "_node_timeouts",
+            {
+                name: self.departure_timeout if node.exit else default_timeout
+                for name, node in self.nodes.items()
+            },
+        )
 
     @staticmethod
     def _normalize_mac(mac: str) -> Mac:
         """Lowercase and replace ``-`` with ``:``."""
-        return Mac(mac.lower().replace("-", ":"))
-
-    @property
-    def node_urls(self) -> dict[NodeName, str]:
-        """Return resolved metrics URLs for all nodes."""
-        return {
-            name: node.url or f"http://{name}:{self.exporter_port}/metrics"
-            for name, node in self.nodes.items()
-        }
-
-    @property
-    def has_exit_nodes(self) -> bool:
-        """Return True if any node is marked as an exit node."""
-        return any(n.exit for n in self.nodes.values())
+        return normalize_mac(mac)
 
     @property
     def tracked_macs(self) -> frozenset[Mac]:
@@ -86,14 +117,10 @@ class Config:
 
         If no exit nodes are configured, all nodes use ``departure_timeout``
         (backward compatible). Otherwise exit nodes use ``departure_timeout``
-        and interior nodes use ``away_timeout``.
+        and interior nodes use ``away_timeout``.  Unknown nodes are
+        treated as interior.  The table is precomputed in ``__post_init__``.
         """
-        if not self.has_exit_nodes:
-            return self.departure_timeout
-        node = self.nodes.get(node_name)
-        if node is not None and node.exit:
-            return self.departure_timeout
-        return self.away_timeout
+        return self._node_timeouts.get(node_name, self._default_timeout)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Config:
@@ -115,9 +142,12 @@ class Config:
         nodes_raw: dict[str, Any] = data.get("nodes", {})
         if not nodes_raw:
             raise ConfigError("At least one node must be configured")
+        # Node names, person names and MACs are interned: they key every
+        # engine/publisher dict and ride on every reading and StateChange,
+        # so lookups hit the identity fast path in str equality.
         nodes: dict[NodeName, NodeConfig] = {}
         for name, ndata in nodes_raw.items():
-            nodes[NodeName(name)] = NodeConfig(
+            nodes[NodeName(sys.intern(name))] = NodeConfig(
                 room=Room(ndata["room"]),
                 url=ndata.get("url"),
                 exit=ndata.get("exit", False),
@@ -131,8 +161,8 @@ class Config:
         people: dict[PersonName, PersonConfig] = {}
         mac_lookup: dict[Mac, PersonName] = {}
         for person_name, pdata in people_raw.items():
-            person = PersonName(person_name)
-            macs = [cls._normalize_mac(m) for m in pdata["macs"]]
+            person = PersonName(sys.intern(person_name))
+            macs = [Mac(sys.intern(cls._normalize_mac(m))) for m in pdata["macs"]]
             for mac in macs:
                 if mac in mac_lookup:
                     raise ConfigError(
@@ -175,7 +205,7 @@ class Config:
     def from_yaml(cls, path: str | Path) -> Config:
         """Load a YAML file and return a validated :class:`Config`."""
         with open(path) as fh:
-            data = yaml.safe_load(fh)
+            data = yaml.load(fh, Loader=_YamlLoader)
         return cls.from_dict(data)
 
     def mac_to_person(self, mac: Mac) -> PersonName | None:
@@ -10,6 +10,7 @@ unrepresentable.
 
 from __future__ import annotations
 
+import string
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Literal, NewType
 
@@ -21,8 +22,23 @@ PersonName = NewType("PersonName", str)
 NodeName = NewType("NodeName", str)
 Room = NewType("Room", str)
 
+# Lowercase and ``-`` → ``:`` in a single C-level pass.
+_MAC_TRANS = str.maketrans(
+    string.ascii_uppercase + "-",
+    string.ascii_lowercase + ":",
+)
 
-@dataclass(frozen=True)
+
+def normalize_mac(raw: str) -> Mac:
+    """Normalize *raw* to the canonical :data:`Mac` form.
+
+    The one normalization used at every boundary (config load and AP
+    scrapes), so both sides of every MAC lookup agree.
+    """
+    return Mac(raw.translate(_MAC_TRANS))
+
+
+@dataclass(frozen=True, slots=True)
 class StationReading:
     """A single RSSI measurement from a Prometheus-compatible TSDB."""
 
@@ -31,7 +47,7 @@ class StationReading:
     rssi: int  # signal strength in dBm
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HomeState:
     """Person is home — room/mac/node/rssi all known and non-optional."""
 
@@ -44,7 +60,7 @@ class HomeState:
     home: Literal[True] = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AwayState:
     """Person is away.
 
@@ -64,7 +80,7 @@ class AwayState:
 StateChange = HomeState | AwayState
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PersonState:
     home: bool
     room: Room | None
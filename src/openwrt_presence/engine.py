@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
 from enum import Enum
 from typing import TYPE_CHECKING
 
@@ -18,6 +18,8 @@ from openwrt_presence.domain import (
 )
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from openwrt_presence.config import Config
 
 
@@ -27,14 +29,15 @@ class DeviceState(Enum):
     AWAY = "away"
 
 
-@dataclass
+@dataclass(slots=True)
 class _DeviceTracker:
     """Internal per-device state tracker."""
 
     state: DeviceState = DeviceState.AWAY
     node: NodeName = field(default_factory=lambda: NodeName(""))
     rssi: int = -100
-    departure_deadline: datetime | None = None
+    # POSIX seconds: the expiry sweep is a float compare, not datetime math.
+    departure_deadline: float | None = None
 
 
 class PresenceEngine:
@@ -47,6 +50,16 @@ class PresenceEngine:
         self._config = config
         self._devices: dict[Mac, _DeviceTracker] = {}
         self._last_person_state: dict[PersonName, PersonState] = {}
+        # Flat node → room table; unknown nodes are simply absent, so one
+        # .get() replaces the NodeConfig lookup plus None check per device.
+        self._node_room: dict[NodeName, Room] = {
+            name: node.room for name, node in config.nodes.items()
+        }
+
+        # Steady-state short-circuit: the previous snapshot's best-reading
+        # table and the earliest pending DEPARTING deadline (inf if none).
+        self._last_visible: dict[Mac, StationReading] | None = None
+        self._next_deadline: float = math.inf
 
         # Initialise every known person to away
         for name in config.people:
@@ -65,15 +78,36 @@ class PresenceEngine:
         - If visible in the snapshot → CONNECTED, update node/rssi.
         - If not visible and was CONNECTED → DEPARTING, set departure deadline.
         - If DEPARTING and deadline passed → AWAY.
+
+        If the tracked readings are identical to the previous snapshot's
+        and no departure deadline is due, every pass is a no-op and ``[]``
+        is returned without touching the trackers.
         """
-        # Build best-RSSI-per-MAC lookup from readings (tracked MACs only)
+        now_ts = now.timestamp()
+
+        # Build best-RSSI-per-MAC lookup from readings (tracked MACs only).
+        # The owner lookup doubles as the tracked filter, so collect the
+        # affected persons here rather than resolving every MAC again below.
         visible: dict[Mac, StationReading] = {}
+        affected: set[PersonName] = set()
         for r in readings:
             mac = r.mac
-            if self._config.mac_to_person(mac) is None:
+            person = self._config.mac_to_person(mac)
+            if person is None:
                 continue
-            if mac not in visible or r.rssi > visible[mac].rssi:
-                visible[mac] = StationReading(mac=mac, ap=r.ap, rssi=r.rssi)
+            affected.add(person)
+            # StationReading is frozen, so the winning reading is kept as-is.
+            best = visible.get(mac)
+            if best is None or r.rssi > best.rssi:
+                visible[mac] = r
+
+        # Exact equality, RSSI included: a changed RSSI can move the room.
+        # The previous full pass left every non-visible device DEPARTING or
+        # AWAY and every person's published state in sync, so with the same
+        # readings only a due deadline could produce a transition.
+        if visible == self._last_visible and now_ts < self._next_deadline:
+            return []
+        self._last_visible = visible
 
         # Update visible MACs → CONNECTED
         for mac, reading in visible.items():
@@ -83,40 +117,45 @@ class PresenceEngine:
             tracker.rssi = reading.rssi
             tracker.departure_deadline = None
 
+        # Only persons with a visible device (collected above) or a device
+        # that transitions below can change state; everyone else's
+        # published state is still current, so they are never recomputed.
+        mac_to_person = self._config.mac_to_person
+
         # Update disappeared MACs → DEPARTING
         for mac, tracker in self._devices.items():
             if mac in visible:
                 continue
-            if tracker.state == DeviceState.CONNECTED:
+            if tracker.state is DeviceState.CONNECTED:
                 tracker.state = DeviceState.DEPARTING
                 timeout = self._config.timeout_for_node(tracker.node)
-                tracker.departure_deadline = now + timedelta(seconds=timeout)
-
-        # Expire DEPARTING → AWAY
-        for _mac, tracker in self._devices.items():
-            if (
-                tracker.state == DeviceState.DEPARTING
-                and tracker.departure_deadline is not None
-                and now >= tracker.departure_deadline
-            ):
-                tracker.state = DeviceState.AWAY
-                tracker.departure_deadline = None
+                tracker.departure_deadline = now_ts + timeout
+                person = mac_to_person(mac)
+                if person is not None:
+                    affected.add(person)
 
-        # Emit changes for all affected persons
-        affected: set[PersonName] = set()
-        for mac in visible:
-            person = self._config.mac_to_person(mac)
-            if person:
-                affected.add(person)
+        # Expire DEPARTING → AWAY, noting the earliest deadline still pending
+        next_deadline = math.inf
         for mac, tracker in self._devices.items():
-            if tracker.state in (DeviceState.DEPARTING, DeviceState.AWAY):
-                person = self._config.mac_to_person(mac)
-                if person:
+            deadline = tracker.departure_deadline
+            if tracker.state is not DeviceState.DEPARTING or deadline is None:
+                continue
+            if now_ts >= deadline:
+                tracker.state = DeviceState.AWAY
+                tracker.departure_deadline = None
+                person = mac_to_person(mac)
+                if person is not None:
                     affected.add(person)
+            elif deadline < next_deadline:
+                next_deadline = deadline
+        self._next_deadline = next_deadline
 
+        # Emit changes for all affected persons
         changes: list[StateChange] = []
         for person in affected:
-            changes.extend(self._emit_changes(person, now))
+            change = self._emit_change(person, now)
+            if change is not None:
+                changes.append(change)
 
         return changes
 
@@ -133,8 +172,7 @@ class PresenceEngine:
         never been seen, returns an :class:`AwayState` with
         ``last_mac``/``last_node`` set to ``None``.
         """
-        state = self._compute_person_state(name)
-        rep = self._best_representative(name)
+        state, rep = self._scan_person(name)
         if state.home and rep is not None:
             mac, node, rssi = rep
             return HomeState(
@@ -159,39 +197,29 @@ class PresenceEngine:
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _best_representative(
-        self, person: PersonName
-    ) -> tuple[Mac, NodeName, int] | None:
-        """Pick the strongest-RSSI device for *person* to represent them.
+    def _compute_person_state(self, name: PersonName) -> PersonState:
+        """Aggregate device states into a person state.
 
-        Returns ``None`` if the person is unknown or has no tracked
-        devices seen yet.  When non-None, ``rssi`` is the device's last
-        recorded RSSI (integer, possibly the default -100 sentinel from
-        the tracker).
+        See :meth:`_scan_person` for the rules and the precondition.
         """
-        person_cfg = self._config.people.get(person)
-        if person_cfg is None:
-            return None
-
-        best: tuple[Mac, NodeName, int] | None = None
-        best_rssi_val = -200
-
-        for mac in person_cfg.macs:
-            tracker = self._devices.get(mac)
-            if tracker is None:
-                continue
-            if tracker.rssi > best_rssi_val:
-                best = (mac, tracker.node, tracker.rssi)
-                best_rssi_val = tracker.rssi
-
-        return best
+        return self._scan_person(name)[0]
 
-    def _compute_person_state(self, name: PersonName) -> PersonState:
-        """Aggregate device states into a person state.
+    def _scan_person(
+        self, name: PersonName
+    ) -> tuple[PersonState, tuple[Mac, NodeName, int] | None]:
+        """Aggregate *name*'s devices into a state and best representative.
 
         Room is determined by the CONNECTED device with the strongest RSSI.
         If all devices are DEPARTING, the last known room is preserved.
 
+        The representative is the strongest-RSSI device in any state, used
+        to fill mac/node/rssi on the emitted change.  It is ``None`` if no
+        device of *name* has been seen yet; otherwise ``rssi`` is the
+        device's last recorded RSSI (possibly the tracker's -100 default).
+
+        Both come out of one pass over the person's MACs — callers need
+        the pair together, and the old split re-scanned every device.
+
         Precondition: *name* must be in ``config.people``.  Callers iterate
         the config; an unknown person is a programmer error, not a runtime
         case.
@@ -199,77 +227,81 @@ class PresenceEngine:
         assert name in self._config.people, (
             f"unknown person {name!r} — callers must iterate config.people"
         )
-        person_cfg = self._config.people[name]
 
         home = False
         best_room: Room | None = None
         best_rssi: int = -200  # impossibly low
+        departing_seen = False
+        departing_room: Room | None = None
+        rep: tuple[Mac, NodeName, int] | None = None
+        rep_rssi: int = -200
 
-        for mac in person_cfg.macs:
+        for mac in self._config.people[name].macs:
             tracker = self._devices.get(mac)
             if tracker is None:
                 continue
 
-            if tracker.state in (DeviceState.CONNECTED, DeviceState.DEPARTING):
-                home = True
+            if tracker.rssi > rep_rssi:
+                rep = (mac, tracker.node, tracker.rssi)
+                rep_rssi = tracker.rssi
 
-            # Room follows the CONNECTED device with strongest RSSI
-            if tracker.state == DeviceState.CONNECTED and tracker.rssi > best_rssi:
-                node_cfg = self._config.nodes.get(tracker.node)
-                room = node_cfg.room if node_cfg is not None else None
-                best_room = room
-                best_rssi = tracker.rssi
+            state = tracker.state
+            if state is DeviceState.CONNECTED:
+                home = True
+                # Room follows the CONNECTED device with strongest RSSI
+                if tracker.rssi > best_rssi:
+                    best_room = self._node_room.get(tracker.node)
+                    best_rssi = tracker.rssi
+            elif state is DeviceState.DEPARTING:
+                home = True
+                if not departing_seen:
+                    departing_seen = True
+                    departing_room = self._node_room.get(tracker.node)
 
         if not home:
-            return PersonState(home=False, room=None)
+            return PersonState(home=False, room=None), rep
 
-        # If all devices are DEPARTING (none CONNECTED), fall back to
-        # any DEPARTING device's last known room.
+        # If no CONNECTED device yielded a room, fall back to the first
+        # DEPARTING device's last known room.
         if best_room is None:
-            for mac in person_cfg.macs:
-                tracker = self._devices.get(mac)
-                if tracker and tracker.state == DeviceState.DEPARTING:
-                    node_cfg = self._config.nodes.get(tracker.node)
-                    best_room = node_cfg.room if node_cfg is not None else None
-                    break
+            best_room = departing_room
 
-        return PersonState(home=True, room=best_room)
+        return PersonState(home=True, room=best_room), rep
 
-    def _emit_changes(
+    def _emit_change(
         self, person: PersonName, timestamp: datetime
-    ) -> list[StateChange]:
-        """Compare computed person state to last published; emit if changed."""
-        new_state = self._compute_person_state(person)
+    ) -> StateChange | None:
+        """Compare computed person state to last published; return it if changed.
+
+        Returns ``None`` on the common no-change path so the caller doesn't
+        allocate a list per person per snapshot.
+        """
+        new_state, rep = self._scan_person(person)
         old_state = self._last_person_state.get(
             person, PersonState(home=False, room=None)
         )
 
         if new_state == old_state:
-            return []
+            return None
 
         self._last_person_state[person] = new_state
 
-        rep = self._best_representative(person)
         if new_state.home and rep is not None:
             mac, node, rssi = rep
-            return [
-                HomeState(
-                    person=person,
-                    room=new_state.room if new_state.room is not None else Room(""),
-                    mac=mac,
-                    node=node,
-                    timestamp=timestamp,
-                    rssi=rssi,
-                )
-            ]
+            return HomeState(
+                person=person,
+                room=new_state.room if new_state.room is not None else Room(""),
+                mac=mac,
+                node=node,
+                timestamp=timestamp,
+                rssi=rssi,
+            )
         if rep is not None:
             mac, node, _ = rep
-            return [
-                AwayState(
-                    person=person,
-                    timestamp=timestamp,
-                    last_mac=mac,
-                    last_node=node,
-                )
-            ]
-        return [AwayState(person=person, timestamp=timestamp)]
+            return AwayState(
+                person=person,
+                timestamp=timestamp,
+                last_mac=mac,
+                last_node=node,
+            )
+        return AwayState(person=person, timestamp=timestamp)
@@ -5,6 +5,7 @@ Audit-log helpers live in :mod:`openwrt_presence.audit`.
 
 from __future__ import annotations
 
+import logging as stdlib_logging
 import sys
 from typing import TYPE_CHECKING, TextIO
 
@@ -41,7 +42,11 @@ def setup_logging(*, file: TextIO | None = None) -> None:
             structlog.processors.EventRenamer("message"),
             structlog.processors.JSONRenderer(),
         ],
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Filtering bound logger: its methods are generated per level at
+        # configure time and feed the processor chain directly, skipping the
+        # stdlib BoundLogger's per-call proxy dispatch.  We write straight to
+        # a stream, so none of the stdlib-specific API was in use anyway.
+        wrapper_class=structlog.make_filtering_bound_logger(stdlib_logging.DEBUG),
         logger_factory=structlog.WriteLoggerFactory(
             file=file if file is not None else sys.stderr,
         ),
@@ -55,9 +55,23 @@ GREEN = "\033[32m"
 YELLOW = "\033[33m"
 CYAN = "\033[36m"
 
+# Color-wrapped glyphs are fixed strings — build them once, not per line.
+_HOME_BULLET = f"{GREEN}●{RESET}"
+_AWAY_BULLET = f"{RED}○{RESET}"
+_HOME_EVENT = f"{GREEN}home{RESET}"
+_AWAY_EVENT = f"{RED}away{RESET}"
+_HOME_MARK = f"{GREEN}✓{RESET}"
+_AWAY_MARK = f"{RED}✓{RESET}"
+_WARNING_PREFIX = f"{YELLOW}⚠{RESET} "
+_ERROR_PREFIX = f"{RED}✗{RESET} "
+
 
 def _parse_time(iso: str) -> str:
     """Extract HH:MM:SS from an ISO timestamp."""
+    # structlog and audit.py emit ``YYYY-MM-DDTHH:MM:SS...``: slice the
+    # fixed offsets and only fall back to a full parse for other shapes.
+    if len(iso) >= 19 and iso[10] == "T" and iso[13] == ":" and iso[16] == ":":
+        return iso[11:19]
     try:
         dt = datetime.fromisoformat(iso)
         return dt.strftime("%H:%M:%S")
@@ -75,11 +89,11 @@ def _format_state_change(data: AuditRecord) -> str:
     event_ts = _parse_time(data.get("event_ts") or data.get("ts", ""))
 
     if event == "home":
-        bullet = f"{GREEN}●{RESET}"
-        event_str = f"{GREEN}home{RESET}"
+        bullet = _HOME_BULLET
+        event_str = _HOME_EVENT
     else:
-        bullet = f"{RED}○{RESET}"
-        event_str = f"{RED}away{RESET}"
+        bullet = _AWAY_BULLET
+        event_str = _AWAY_EVENT
 
     room_str = f"  {CYAN}{room}{RESET}" if room else ""
     rssi_str = f" {rssi}dBm" if rssi is not None else ""
@@ -95,7 +109,7 @@ def _format_state_delivered(data: AuditRecord) -> str:
     person = data.get("person", "?")
     event = data.get("presence", "?")
     ts = _parse_time(data.get("ts", ""))
-    mark = f"{GREEN}✓{RESET}" if event == "home" else f"{RED}✓{RESET}"
+    mark = _HOME_MARK if event == "home" else _AWAY_MARK
     return f"{DIM}{ts}{RESET}  {mark} {DIM}{person} {event} delivered{RESET}"
 
 
@@ -105,9 +119,9 @@ def _format_log(data: AuditRecord) -> str:
     message = data.get("message", "")
 
     if level == "WARNING":
-        prefix = f"{YELLOW}⚠{RESET} "
+        prefix = _WARNING_PREFIX
     elif level == "ERROR":
-        prefix = f"{RED}✗{RESET} "
+        prefix = _ERROR_PREFIX
     else:
         prefix = "  "
 
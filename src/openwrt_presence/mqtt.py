@@ -44,10 +44,28 @@ class MqttPublisher:
         self._config = config
         self._client = client
         self._topic_prefix = config.mqtt.topic_prefix
+        self._availability_topic = f"{self._topic_prefix}/status"
+        # (state, room, attributes) topics per person, formatted once here
+        # rather than three f-strings on every publish.  Kept as str: paho's
+        # publish() takes topics as str and encodes them itself.
+        self._state_topics: dict[PersonName, tuple[str, str, str]] = {
+            person: (
+                f"{self._topic_prefix}/{person}/state",
+                f"{self._topic_prefix}/{person}/room",
+                f"{self._topic_prefix}/{person}/attributes",
+            )
+            for person in config.people
+        }
+        # Discovery configs depend only on config, yet are republished on
+        # every (re)connect — serialise them once.
+        self._discovery: list[tuple[str, str]] = []
+        for person in config.people:
+            self._discovery.append(self._device_tracker_discovery(person))
+            self._discovery.append(self._room_sensor_discovery(person))
 
     @property
     def availability_topic(self) -> str:
-        return f"{self._topic_prefix}/status"
+        return self._availability_topic
 
     @staticmethod
     def _device_block() -> dict[str, Any]:
@@ -59,11 +77,10 @@ class MqttPublisher:
 
     def publish_discovery(self) -> None:
         """Publish HA MQTT Discovery config for every tracked person."""
-        for person in self._config.people:
-            self._publish_device_tracker_discovery(person)
-            self._publish_room_sensor_discovery(person)
+        for topic, payload in self._discovery:
+            self._client.publish(topic, payload, qos=_QOS, retain=True)
 
-    def _publish_device_tracker_discovery(self, person: PersonName) -> None:
+    def _device_tracker_discovery(self, person: PersonName) -> tuple[str, str]:
         topic = f"homeassistant/device_tracker/{person}_wifi/config"
         payload = {
             "name": f"{person.title()} WiFi",
@@ -76,9 +93,9 @@ class MqttPublisher:
             "availability_topic": self.availability_topic,
             "device": self._device_block(),
         }
-        self._client.publish(topic, json.dumps(payload), qos=_QOS, retain=True)
+        return topic, json.dumps(payload)
 
-    def _publish_room_sensor_discovery(self, person: PersonName) -> None:
+    def _room_sensor_discovery(self, person: PersonName) -> tuple[str, str]:
         topic = f"homeassistant/sensor/{person}_room/config"
         payload = {
             "name": f"{person.title()} Room",
@@ -88,7 +105,7 @@ class MqttPublisher:
             "icon": "mdi:map-marker",
             "device": self._device_block(),
         }
-        self._client.publish(topic, json.dumps(payload), qos=_QOS, retain=True)
+        return topic, json.dumps(payload)
 
     def publish_state(self, change: StateChange) -> None:
         """Publish state, room, and attributes for a person.
@@ -140,13 +157,11 @@ class MqttPublisher:
                     "rssi": None,
                 }
 
+        state_topic, room_topic, attrs_topic = self._state_topics[change.person]
         topics_payloads = (
-            (f"{self._topic_prefix}/{change.person}/state", state_value),
-            (f"{self._topic_prefix}/{change.person}/room", room_value),
-            (
-                f"{self._topic_prefix}/{change.person}/attributes",
-                json.dumps(attrs),
-            ),
+            (state_topic, state_value),
+            (room_topic, room_value),
+            (attrs_topic, json.dumps(attrs)),
         )
 
         all_ok = True
@@ -4,19 +4,26 @@ from __future__ import annotations
 
 import asyncio
 import re
+import sys
 from typing import TYPE_CHECKING
 
 import aiohttp
 import structlog
 
-from openwrt_presence.domain import Mac, NodeName, StationReading
+from openwrt_presence.domain import (
+    Mac,
+    NodeName,
+    StationReading,
+    normalize_mac,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Set as AbstractSet
 
-_METRIC_PREFIX = "wifi_station_signal_dbm"
+_METRIC_PREFIX = b"wifi_station_signal_dbm"
+_METRIC_LINE_START = b"\n" + _METRIC_PREFIX
 _METRIC_RE = re.compile(
-    r'^wifi_station_signal_dbm\{[^}]*mac="([^"]+)"[^}]*\}\s+(-?\d+(?:\.\d+)?)\s*$',
+    rb'^wifi_station_signal_dbm\{[^}]*mac="([^"]+)"[^}]*\}\s+(-?\d+)(?:\.\d+)?\s*$',
 )
 
 
@@ -35,7 +42,7 @@ class ExporterSource:
         self._connector: aiohttp.TCPConnector | None = None
         self._session: aiohttp.ClientSession | None = None
         self._node_healthy: dict[NodeName, bool] = {}
-        self._log: structlog.stdlib.BoundLogger = structlog.get_logger()
+        self._log: structlog.typing.FilteringBoundLogger = structlog.get_logger()
 
     def _get_session(self) -> aiohttp.ClientSession:
         if self._connector is None or self._connector.closed:
@@ -65,21 +72,25 @@ class ExporterSource:
         """
         readings: list[StationReading] = []
         session = self._get_session()
-        tasks = {
-            node: asyncio.create_task(self._scrape_ap(session, node, url))
-            for node, url in self._node_urls.items()
-        }
-        for node, task in tasks.items():
+        # return_exceptions: one slow or failing AP must not abort or delay
+        # bookkeeping for the others; per-node outcomes are handled below.
+        results = await asyncio.gather(
+            *(
+                self._scrape_ap(session, node, url)
+                for node, url in self._node_urls.items()
+            ),
+            return_exceptions=True,
+        )
+        for node, result in zip(self._node_urls, results, strict=True):
             first_seen = node not in self._node_healthy
-            try:
-                ap_readings = await task
-                readings.extend(ap_readings)
+            if isinstance(result, list):
+                readings.extend(result)
                 if first_seen:
                     self._log.info("initial_node_state", node=node, healthy=True)
                 elif not self._node_healthy[node]:
                     self._log.info("node_recovered", node=node)
                 self._node_healthy[node] = True
-            except Exception as exc:
+            elif isinstance(result, Exception):
                 was_healthy = self._node_healthy.get(node, True)
                 self._node_healthy[node] = False
                 if first_seen:
@@ -88,10 +99,13 @@ class ExporterSource:
                     self._log.warning(
                         "node_unreachable",
                         node=node,
-                        error=type(exc).__name__,
+                        error=type(result).__name__,
                     )
+            else:
+                # CancelledError / KeyboardInterrupt: not a node failure.
+                raise result
 
-        return self._filter_tracked(readings)
+        return readings
 
     async def _scrape_ap(
         self,
@@ -101,23 +115,31 @@ class ExporterSource:
     ) -> list[StationReading]:
         """Scrape a single AP and parse its metrics.
 
-        Uses ``response.text()`` which reads until EOF — a prior attempt
+        Uses ``response.read()`` which reads until EOF — a prior attempt
         with ``response.content.read(1<<20)`` truncated at the first TCP
         chunk (StreamReader.read(n) is single-chunk on aiohttp, not "read
         until n bytes or EOF"), silently dropping every wifi metric past
         byte ~2000 on real APs.  The 5s ``ClientTimeout`` in the session
         already bounds the scrape against a pathological exporter — no
-        additional body cap is needed on a trusted LAN.
+        additional body cap is needed on a trusted LAN.  The body is kept
+        as bytes: the exposition format is ASCII, so decoding the whole
+        page to ``str`` only to match a few lines is wasted work.
         """
         async with session.get(url) as response:
             response.raise_for_status()
-            text = await response.text()
-        return self._parse_metrics(text, node)
+            body = await response.read()
+        return self._parse_metrics(body, node, self._tracked_macs)
 
     @staticmethod
-    def _parse_metrics(text: str, ap: NodeName) -> list[StationReading]:
+    def _parse_metrics(
+        body: bytes, ap: NodeName, tracked: AbstractSet[Mac]
+    ) -> list[StationReading]:
         """Parse Prometheus text exposition format for wifi RSSI metrics.
 
+        Only stations whose MAC is in *tracked* become readings; the filter
+        runs inside the scan so untracked stations never allocate one.
+        Every candidate line is still validated, tracked or not.
+
         Lines that look like our metric (start with the prefix) but fail to
         parse raise ValueError. That bubbles up to the per-AP try/except in
         query() and the node gets marked unhealthy — the operator sees
@@ -125,20 +147,39 @@ class ExporterSource:
         an AP hides real bugs.
         """
         readings: list[StationReading] = []
-        for line in text.splitlines():
-            if not line.startswith(_METRIC_PREFIX):
-                continue
+        # Jump straight between our metric's lines with find() instead of
+        # splitting the whole body: the exporter page is mostly node_* and
+        # HELP/TYPE lines we would otherwise allocate just to discard.
+        if body.startswith(_METRIC_PREFIX):
+            start = 0
+        else:
+            start = body.find(_METRIC_LINE_START) + 1
+            if start == 0:
+                return readings
+        while True:
+            end = body.find(b"\n", start)
+            line = body[start:] if end == -1 else body[start:end]
             m = _METRIC_RE.match(line)
             if m is None:
                 raise ValueError(f"{ap}: malformed metric line: {line!r}")
-            mac = Mac(m.group(1).lower().replace("-", ":"))
-            rssi = int(float(m.group(2)))
-            readings.append(StationReading(mac=mac, ap=ap, rssi=rssi))
-        return readings
-
-    def _filter_tracked(self, readings: list[StationReading]) -> list[StationReading]:
-        """Keep only readings for tracked MACs."""
-        return [r for r in readings if r.mac in self._tracked_macs]
+            mac = normalize_mac(m.group(1).decode("ascii"))
+            if mac in tracked:
+                # Interned so the engine's per-MAC dict probes hit the
+                # identity fast path against the (also interned) config keys.
+                readings.append(
+                    StationReading(
+                        mac=Mac(sys.intern(mac)),
+                        ap=ap,
+                        # Integer part captured on its own: int() on it is
+                        # int(float()) truncation without the float.
+                        rssi=int(m.group(2)),
+                    )
+                )
+            if end == -1:
+                return readings
+            start = body.find(_METRIC_LINE_START, end) + 1
+            if start == 0:
+                return readings
 
     @property
     def all_nodes_unhealthy(self) -> bool:
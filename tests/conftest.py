@@ -13,10 +13,13 @@ from openwrt_presence.config import (
 from openwrt_presence.domain import Mac, NodeName, PersonName, Room
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_config() -> Config:
     """Canonical config for integration tests.
 
+    Session-scoped: ``Config`` is frozen and no test mutates its
+    contents, so one instance is shared across the whole run.
+
     Nodes:
       - ap-garden (exit, room=garden)
       - ap-living (interior, room=office)
@@ -58,9 +61,12 @@ def sample_config() -> Config:
     )
 
 
+_T0 = datetime(2026, 1, 1, tzinfo=UTC)
+
+
 def _ts(minutes: float = 0) -> datetime:
     """Deterministic timestamp helper."""
-    return datetime(2026, 1, 1, 0, 0, 0, tzinfo=UTC) + timedelta(minutes=minutes)
+    return _T0 + timedelta(minutes=minutes)
 
 
 @pytest.fixture
@@ -49,6 +49,20 @@ class TestConfigLoading:
     def test_normalize_mac_replaces_dashes(self):
         assert Config._normalize_mac("AA-BB-CC-DD-EE-01") == "aa:bb:cc:dd:ee:01"
 
+    def test_from_yaml(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text(
+            "mqtt: {host: localhost, port: 1883, topic_prefix: test}\n"
+            "nodes:\n"
+            "  ap1: {room: room1}\n"
+            "departure_timeout: 120\n"
+            "people:\n"
+            "  alice: {macs: ['AA-BB-CC-DD-EE-01']}\n"
+        )
+        cfg = Config.from_yaml(path)
+        assert cfg.nodes[NodeName("ap1")].room == "room1"
+        assert cfg.mac_to_person(Mac("aa:bb:cc:dd:ee:01")) == "alice"
+
     def test_exporter_port_default(self, sample_config: Config):
         assert sample_config.exporter_port == 9100
 
@@ -181,6 +195,10 @@ class TestExitNodes:
         cfg = Config.from_dict(_base_config())
         assert cfg.timeout_for_node(NodeName("ap1")) == 120  # departure_timeout for all
 
+    def test_timeout_for_unknown_node_no_exit_nodes(self):
+        cfg = Config.from_dict(_base_config())
+        assert cfg.timeout_for_node(NodeName("unknown")) == 120
+
     def test_timeout_for_node_with_exit_nodes(self):
         cfg = Config.from_dict(
             _base_config(
@@ -211,3 +229,16 @@ class TestConfigImmutability:
             }
         )
         assert sample_config.tracked_macs == expected
+
+    def test_derived_fields_frozen(self, sample_config: Config):
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            sample_config.node_urls = {}  # type: ignore[misc]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            sample_config.has_exit_nodes = False  # type: ignore[misc]
+
+    def test_derived_fields_computed_from_constructor(self, sample_config: Config):
+        """Direct construction (as the fixture does) still derives them."""
+        assert sample_config.has_exit_nodes is True
+        assert sample_config.node_urls[NodeName("ap-garden")] == (
+            "http://ap-garden:9100/metrics"
+        )
@@ -7,6 +7,7 @@ from openwrt_presence.domain import (
     NodeName,
     PersonName,
     Room,
+    normalize_mac,
 )
 
 
@@ -16,6 +17,11 @@ def test_newtypes_are_str_at_runtime():
     assert m == "aa:bb:cc:dd:ee:01"
 
 
+def test_normalize_mac_lowercases_and_replaces_dashes():
+    assert normalize_mac("AA-BB-CC-DD-EE-0F") == "aa:bb:cc:dd:ee:0f"
+    assert normalize_mac("aa:bb:cc:dd:ee:0f") == "aa:bb:cc:dd:ee:0f"
+
+
 def test_newtypes_distinct_at_typecheck():
     # Pyright should flag this (we rely on CI gating); runtime is str.
     p = PersonName("alice")
@@ -17,8 +17,11 @@ def _reading(mac: str, ap: str, rssi: int) -> StationReading:
     return StationReading(mac=Mac(mac), ap=NodeName(ap), rssi=rssi)
 
 
+_T0 = datetime(2026, 1, 1, tzinfo=UTC)
+
+
 def _ts(minutes: float = 0) -> datetime:
-    return datetime(2026, 1, 1, tzinfo=UTC) + timedelta(minutes=minutes)
+    return _T0 + timedelta(minutes=minutes)
 
 
 class TestSnapshotBasicTransitions:
@@ -220,7 +223,8 @@ class TestNoSpuriousChanges:
         )
         assert changes == []
 
-    def test_away_then_return(self, sample_config):
+    def test_repeated_empty_snapshots_still_expire(self, sample_config):
+        """Identical snapshots skip work, but a due deadline still fires."""
         engine = PresenceEngine(sample_config)
         engine.process_snapshot(
             _ts(0),
@@ -228,26 +232,32 @@ class TestNoSpuriousChanges:
                 _reading("aa:bb:cc:dd:ee:01", "ap-garden", -55),
             ],
         )
-        # Disappear and timeout
-        engine.process_snapshot(_ts(1), [])
-        engine.process_snapshot(_ts(5), [])  # past 120s timeout
-        # Return
+        assert engine.process_snapshot(_ts(1), []) == []
+        assert engine.process_snapshot(_ts(2), []) == []  # before 120s
+        changes = engine.process_snapshot(_ts(3), [])  # past 120s
+        assert len(changes) == 1
+        assert changes[0].home is False
+
+    def test_rssi_change_in_repeated_snapshot_moves_room(self, sample_config):
+        engine = PresenceEngine(sample_config)
+        snapshot = [
+            _reading("aa:bb:cc:dd:ee:01", "ap-living", -60),
+            _reading("aa:bb:cc:dd:ee:01", "ap-bedroom", -70),
+        ]
+        engine.process_snapshot(_ts(0), snapshot)
+        assert engine.process_snapshot(_ts(1), snapshot) == []
         changes = engine.process_snapshot(
-            _ts(10),
+            _ts(2),
             [
+                _reading("aa:bb:cc:dd:ee:01", "ap-living", -60),
                 _reading("aa:bb:cc:dd:ee:01", "ap-bedroom", -50),
             ],
         )
         assert len(changes) == 1
-        assert changes[0].home is True
+        assert isinstance(changes[0], HomeState)
         assert changes[0].room == "bedroom"
 
-
-class TestExitNodeTimeouts:
-    """Departure timeout depends on last-seen node type."""
-
-    def test_exit_node_uses_departure_timeout(self, sample_config):
-        """Exit node (ap-garden) uses departure_timeout (120s)."""
+    def test_away_then_return(self, sample_config):
         engine = PresenceEngine(sample_config)
         engine.process_snapshot(
             _ts(0),
@@ -255,42 +265,54 @@ class TestExitNodeTimeouts:
                 _reading("aa:bb:cc:dd:ee:01", "ap-garden", -55),
             ],
         )
+        # Disappear and timeout
         engine.process_snapshot(_ts(1), [])
-        # Past departure_timeout (120s = 2 min) but before away_timeout
-        changes = engine.process_snapshot(_ts(4), [])
-        assert len(changes) == 1
-        assert changes[0].home is False
-
-    def test_interior_node_uses_away_timeout(self, sample_config):
-        """Interior node (ap-living) uses away_timeout (600s = 10 min)."""
-        engine = PresenceEngine(sample_config)
-        engine.process_snapshot(
-            _ts(0),
+        engine.process_snapshot(_ts(5), [])  # past 120s timeout
+        # Return
+        changes = engine.process_snapshot(
+            _ts(10),
             [
-                _reading("aa:bb:cc:dd:ee:01", "ap-living", -45),
+                _reading("aa:bb:cc:dd:ee:01", "ap-bedroom", -50),
             ],
         )
-        engine.process_snapshot(_ts(1), [])
-        # Past departure_timeout (2 min) but before away_timeout (10 min)
-        changes = engine.process_snapshot(_ts(4), [])
-        assert changes == []
-        state = engine.get_person_state(PersonName("alice"))
-        assert state.home is True
+        assert len(changes) == 1
+        assert changes[0].home is True
+        assert changes[0].room == "bedroom"
+
+
+class TestExitNodeTimeouts:
+    """Departure timeout depends on last-seen node type."""
 
-    def test_interior_node_eventually_times_out(self, sample_config):
-        """Interior node device does eventually go away after away_timeout."""
+    @pytest.mark.parametrize(
+        ("ap", "final_minute", "expected_home"),
+        [
+            # Exit node: past departure_timeout (2 min) → away
+            pytest.param("ap-garden", 4, False, id="exit-uses-departure-timeout"),
+            # Interior node: past departure_timeout, before away_timeout (10 min)
+            pytest.param("ap-living", 4, True, id="interior-uses-away-timeout"),
+            # Interior node: past away_timeout → eventually away
+            pytest.param("ap-living", 12, False, id="interior-eventually-times-out"),
+        ],
+    )
+    def test_timeout_follows_last_seen_node(
+        self, sample_config, ap, final_minute, expected_home
+    ):
         engine = PresenceEngine(sample_config)
         engine.process_snapshot(
             _ts(0),
             [
-                _reading("aa:bb:cc:dd:ee:01", "ap-living", -45),
+                _reading("aa:bb:cc:dd:ee:01", ap, -50),
             ],
         )
         engine.process_snapshot(_ts(1), [])
-        # Past away_timeout (600s = 10 min)
-        changes = engine.process_snapshot(_ts(12), [])
-        assert len(changes) == 1
-        assert changes[0].home is False
+        changes = engine.process_snapshot(_ts(final_minute), [])
+        if expected_home:
+            assert changes == []
+        else:
+            assert len(changes) == 1
+            assert changes[0].home is False
+        state = engine.get_person_state(PersonName("alice"))
+        assert state.home is expected_home
 
     def test_device_moves_to_exit_then_disappears(self, sample_config):
         """Device seen on interior, then exit, then disappears → short timeout."""
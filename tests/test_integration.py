@@ -15,9 +15,11 @@ from openwrt_presence.domain import (
 )
 from openwrt_presence.engine import PresenceEngine
 
+_T0 = datetime(2026, 1, 1, tzinfo=UTC)
+
 
 def _ts(minutes: float = 0) -> datetime:
-    return datetime(2026, 1, 1, tzinfo=UTC) + timedelta(minutes=minutes)
+    return _T0 + timedelta(minutes=minutes)
 
 
 def _reading(mac: str, ap: str, rssi: int) -> StationReading:
@@ -5,6 +5,7 @@ from __future__ import annotations
 import io
 import json
 
+import pytest
 from aiohttp import web
 
 from openwrt_presence.domain import Mac, NodeName
@@ -12,7 +13,7 @@ from openwrt_presence.logging import setup_logging
 from openwrt_presence.sources.exporters import ExporterSource
 
 # ── shared fixtures/constants ─────────────────────────────────────────
-SAMPLE_METRICS = """\
+SAMPLE_METRICS = b"""\
 # HELP wifi_station_signal_dbm Signal strength of associated stations
 # TYPE wifi_station_signal_dbm gauge
 wifi_station_signal_dbm{ifname="phy1-ap0",mac="AA:BB:CC:11:22:01"} -55
@@ -22,21 +23,13 @@ wifi_station_signal_dbm{ifname="phy0-ap0",mac="AA:BB:CC:11:22:05"} -63
 # TYPE node_cpu_seconds_total counter
 node_cpu_seconds_total{cpu="0",mode="idle"} 123456.78
 """
-
-
-def _make_source(
-    node_urls: dict[str, str] | None = None,
-    tracked_macs: set[str] | None = None,
-) -> ExporterSource:
-    raw_urls = node_urls or {
-        "ap-living": "http://ap-living:9100/metrics",
-        "ap-bedroom": "http://ap-bedroom:9100/metrics",
+SAMPLE_MACS = frozenset(
+    {
+        Mac("aa:bb:cc:11:22:01"),
+        Mac("aa:bb:cc:11:22:04"),
+        Mac("aa:bb:cc:11:22:05"),
     }
-    raw_macs = tracked_macs or {"aa:bb:cc:dd:ee:01", "aa:bb:cc:dd:ee:02"}
-    return ExporterSource(
-        node_urls={NodeName(k): v for k, v in raw_urls.items()},
-        tracked_macs={Mac(m) for m in raw_macs},
-    )
+)
 
 
 def _log_lines(stream: io.StringIO) -> list[dict]:
@@ -49,53 +42,82 @@ def _log_lines(stream: io.StringIO) -> list[dict]:
 # ── parser tests (pure logic, no network) ─────────────────────────────
 class TestMetricsParsing:
     def test_parses_wifi_station_lines(self):
-        readings = ExporterSource._parse_metrics(SAMPLE_METRICS, NodeName("ap-living"))
+        readings = ExporterSource._parse_metrics(
+            SAMPLE_METRICS, NodeName("ap-living"), SAMPLE_MACS
+        )
         assert len(readings) == 3
 
     def test_extracts_mac_lowercase(self):
-        readings = ExporterSource._parse_metrics(SAMPLE_METRICS, NodeName("ap-living"))
+        readings = ExporterSource._parse_metrics(
+            SAMPLE_METRICS, NodeName("ap-living"), SAMPLE_MACS
+        )
         macs = {r.mac for r in readings}
         assert "aa:bb:cc:11:22:01" in macs
         assert "aa:bb:cc:11:22:04" in macs
 
     def test_extracts_rssi_as_int(self):
-        readings = ExporterSource._parse_metrics(SAMPLE_METRICS, NodeName("ap-living"))
+        readings = ExporterSource._parse_metrics(
+            SAMPLE_METRICS, NodeName("ap-living"), SAMPLE_MACS
+        )
         by_mac = {r.mac: r for r in readings}
         assert by_mac[Mac("aa:bb:cc:11:22:01")].rssi == -55
         assert by_mac[Mac("aa:bb:cc:11:22:04")].rssi == -42
 
     def test_ap_name_set_from_argument(self):
-        readings = ExporterSource._parse_metrics(SAMPLE_METRICS, NodeName("ap-bedroom"))
+        readings = ExporterSource._parse_metrics(
+            SAMPLE_METRICS, NodeName("ap-bedroom"), SAMPLE_MACS
+        )
         assert all(r.ap == "ap-bedroom" for r in readings)
 
     def test_ignores_non_wifi_metrics(self):
-        readings = ExporterSource._parse_metrics(SAMPLE_METRICS, NodeName("ap-living"))
+        readings = ExporterSource._parse_metrics(
+            SAMPLE_METRICS, NodeName("ap-living"), SAMPLE_MACS
+        )
         assert all(r.rssi < 0 for r in readings)
 
     def test_empty_metrics(self):
-        readings = ExporterSource._parse_metrics("", NodeName("ap-living"))
+        readings = ExporterSource._parse_metrics(
+            b"", NodeName("ap-living"), SAMPLE_MACS
+        )
         assert readings == []
 
     def test_no_wifi_metrics(self):
-        text = 'node_cpu_seconds_total{cpu="0"} 123.45\n'
-        readings = ExporterSource._parse_metrics(text, NodeName("ap-living"))
+        text = b'node_cpu_seconds_total{cpu="0"} 123.45\n'
+        readings = ExporterSource._parse_metrics(
+            text, NodeName("ap-living"), SAMPLE_MACS
+        )
         assert readings == []
 
     def test_handles_float_rssi(self):
         text = (
-            'wifi_station_signal_dbm{ifname="phy1-ap0",mac="AA:BB:CC:DD:EE:01"} -55.7\n'
+            b'wifi_station_signal_dbm{ifname="phy1-ap0",mac="AA:BB:CC:DD:EE:01"}'
+            b" -55.7\n"
+        )
+        readings = ExporterSource._parse_metrics(
+            text, NodeName("ap-living"), {Mac("aa:bb:cc:dd:ee:01")}
         )
-        readings = ExporterSource._parse_metrics(text, NodeName("ap-living"))
         assert readings[0].rssi == -55
 
+    def test_last_line_without_trailing_newline(self):
+        text = SAMPLE_METRICS + b'wifi_station_signal_dbm{mac="AA:BB:CC:DD:EE:09"} -70'
+        readings = ExporterSource._parse_metrics(
+            text, NodeName("ap-living"), SAMPLE_MACS | {Mac("aa:bb:cc:dd:ee:09")}
+        )
+        assert readings[-1].mac == "aa:bb:cc:dd:ee:09"
+        assert len(readings) == 4
+
     def test_filters_to_tracked_macs(self):
-        source = _make_source(tracked_macs={"aa:bb:cc:11:22:01"})
-        readings = source._filter_tracked(
-            ExporterSource._parse_metrics(SAMPLE_METRICS, NodeName("ap-living"))
+        readings = ExporterSource._parse_metrics(
+            SAMPLE_METRICS, NodeName("ap-living"), {Mac("aa:bb:cc:11:22:01")}
         )
         assert len(readings) == 1
         assert readings[0].mac == "aa:bb:cc:11:22:01"
 
+    def test_untracked_malformed_line_still_raises(self):
+        text = b'wifi_station_signal_dbm{mac="AA:BB:CC:DD:EE:99"} garbage\n'
+        with pytest.raises(ValueError, match="malformed metric line"):
+            ExporterSource._parse_metrics(text, NodeName("ap-living"), SAMPLE_MACS)
+
 
 # ── HTTP integration tests (aiohttp test server) ──────────────────────
 _METRICS_SAMPLE_SHORT = """# HELP wifi_station_signal_dbm
@@ -314,8 +336,8 @@ class TestLargeChunkedBody:
     buffered chunk and silently dropped everything after, causing 0
     readings from real APs whose ``wifi_station_signal_dbm`` lines live
     past the first chunk (prometheus-node-exporter-lua emits ``node_*``
-    metrics first).  The fix is ``await response.text()`` which reads
-    until EOF.
+    metrics first).  The fix is ``await response.read()``, which (unlike
+    the single-chunk ``content.read(n)``) reads until EOF.
     """
 
     async def test_reads_full_body_when_metrics_past_first_chunk(